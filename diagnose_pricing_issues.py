@@ -7,14 +7,22 @@ might not appear in the generated reports, focusing on pricing-related exclusion
 """
 
 import os
+import sys
 import json
 import logging
+import bisect
+import glob
+import hashlib
+import itertools
 import smartsheet
 from datetime import datetime
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from generate_weekly_pdfs import (
     discover_source_sheets, get_all_source_rows, 
-    parse_price, is_checked, excel_serial_to_date
+    parse_price as _parse_price_uncached, is_checked, excel_serial_to_date,
+    PARALLEL_WORKERS, PARALLEL_WORKERS_DISCOVERY, OUTPUT_FOLDER
 )
 
 # Enable comprehensive diagnostics
@@ -27,7 +35,35 @@ os.environ['LOG_UNKNOWN_COLUMNS'] = 'true'
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def analyze_pricing_issues():
+# Raw price values repeat heavily across rows and are parsed by both
+# analysis passes, so memoize per raw value. typed=True keeps True and 1
+# apart (parse_price(True) is 0.0, parse_price(1) is 1.0).
+parse_price = lru_cache(maxsize=65536, typed=True)(_parse_price_uncached)
+
+# Price-range buckets for analyze_pricing_patterns: bisect_right over the
+# upper edges picks the label; an exact $0 is bucketed separately.
+_PRICE_RANGE_EDGES = (100, 1000, 5000)
+_PRICE_RANGE_LABELS = ('$0.01-$99.99', '$100-$999.99', '$1,000-$4,999.99', '$5,000+')
+
+# Fixed exclusion buckets tallied by analyze_completed_rows_with_dates.
+_MISSING_FIELD_ISSUES = ('price_completely_missing', 'price_zero_or_negative', 'price_parse_error')
+
+# The only fields _analyze_completed_sheet_rows reads once a row is known
+# to be completed; other mapped columns are never extracted.
+_COMPLETED_ROW_FIELDS = ('Snapshot Date', 'Weekly Reference Logged Date', 'Work Request #', 'Units Total Price')
+
+# Distinct issue strings kept per WR in analyze_pricing_patterns; a WR with
+# hundreds of identical bad rows only needs a handful of examples.
+_MAX_ISSUES_PER_WR = 8
+
+# Opt-in on-disk copies of column-filtered sheet rows, keyed by sheet
+# version, so repeated diagnostic runs skip the download when a sheet is
+# unchanged. Lives beside discovery_cache.json and, like it, is switched by
+# a USE_*_CACHE env var - but off by default, since it holds billing rows.
+USE_DIAG_SHEET_CACHE = os.getenv('USE_DIAG_SHEET_CACHE', '0').lower() in ('1', 'true', 'yes')
+DIAG_SHEET_CACHE_DIR = os.path.join(OUTPUT_FOLDER, 'diagnose_sheet_cache')
+
+def analyze_pricing_issues(use_cache=USE_DIAG_SHEET_CACHE):
     """Comprehensive analysis of pricing issues in completed work items."""
     
     print("🔍 PRICING DIAGNOSTIC ANALYSIS")
@@ -41,11 +77,22 @@ def analyze_pricing_issues():
             analyze_filtering_logic()
             return
         
-        client = smartsheet.Smartsheet(API_TOKEN)
+        # The SDK already keeps one pooled keep-alive session per client and
+        # retries rate limits itself; size that pool to the widest thread
+        # fan-out so concurrent fetches don't discard connections and pay
+        # a fresh TLS handshake.
+        client = smartsheet.Smartsheet(
+            API_TOKEN,
+            max_connections=max(PARALLEL_WORKERS, PARALLEL_WORKERS_DISCOVERY),
+            user_agent='diagnose_pricing_issues',
+        )
         client.errors_as_exceptions(True)
         
         source_sheets = discover_source_sheets(client)
         
+        # Both row passes below fetch the same column-filtered sheets
+        client = _SharedFetchClient(client, DIAG_SHEET_CACHE_DIR if use_cache else None)
+        
         print(f"\n📊 Found {len(source_sheets)} source sheets")
         for i, sheet in enumerate(source_sheets, 1):
             print(f"   {i}. {sheet['name']} (ID: {sheet['id']})")
@@ -74,6 +121,121 @@ def analyze_pricing_issues():
         import traceback
         traceback.print_exc()
 
+class _SharedFetchClient:
+    """Smartsheet client wrapper whose ``Sheets.get_sheet`` is memoized.
+    
+    get_all_source_rows and analyze_completed_rows_with_dates both fetch
+    every source sheet restricted to its mapped columns, so both passes are
+    handed this wrapper and the second pass reuses the first pass's
+    response instead of downloading each sheet again. An entry is dropped
+    once the memo has served it, so each sheet's SDK objects are freed
+    after the second pass reads them rather than held for the whole run.
+    The real SDK client is never modified; every other attribute is
+    delegated to it.
+    
+    Only calls of the exact shape ``get_sheet(sheet_id, column_ids=...)``
+    are memoized. That is the shape pipeline.fetch and
+    _fetch_mapped_columns both use (``column_ids`` as the one keyword,
+    comma-joined); if either call site adds another argument, the memo
+    silently stops hitting and each pass fetches again. Any other call
+    shape (discovery's ``include='columns'`` probes, row samples) passes
+    straight through.
+    
+    With ``cache_dir`` set, each response is also written there as JSON
+    under the sheet's current version; a later run asks only for the
+    version (one tiny request) and loads the file when it still matches.
+    """
+    
+    def __init__(self, client, cache_dir=None):
+        self._client = client
+        self.Sheets = _SharedFetchSheets(client.Sheets, cache_dir)
+    
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+class _SharedFetchSheets:
+    """``Sheets`` API wrapper backing ``_SharedFetchClient``."""
+    
+    def __init__(self, sheets_api, cache_dir):
+        self._sheets_api = sheets_api
+        self._cache_dir = cache_dir
+        self._fetched = {}
+    
+    def __getattr__(self, name):
+        return getattr(self._sheets_api, name)
+    
+    def get_sheet(self, sheet_id, *args, **kwargs):
+        if args or list(kwargs) != ['column_ids']:
+            return self._sheets_api.get_sheet(sheet_id, *args, **kwargs)
+        key = (sheet_id, kwargs['column_ids'])
+        sheet = self._fetched.pop(key, None)
+        if sheet is not None:
+            # Second (and last) reader of this fetch - release it.
+            return sheet
+        if self._cache_dir:
+            sheet = _load_or_fetch_sheet(
+                self._sheets_api, self._cache_dir, sheet_id, kwargs['column_ids']
+            )
+        else:
+            sheet = self._sheets_api.get_sheet(sheet_id, **kwargs)
+        self._fetched[key] = sheet
+        return sheet
+
+def _load_or_fetch_sheet(sheets_api, cache_dir, sheet_id, column_ids):
+    """Return the cached payload for the sheet's current version, or fetch and store it."""
+    try:
+        version = sheets_api.get_sheet_version(sheet_id).version
+    except Exception as e:
+        logging.warning(f"Sheet cache: version lookup failed for {sheet_id} ({e}); fetching live")
+        return sheets_api.get_sheet(sheet_id, column_ids=column_ids)
+    columns_key = hashlib.sha1(column_ids.encode('utf-8')).hexdigest()[:12]
+    cache_path = os.path.join(cache_dir, f"sheet_{sheet_id}_v{version}_{columns_key}.json")
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as f:
+                return smartsheet.models.Sheet(json.load(f))
+        except (OSError, ValueError) as e:
+            logging.warning(f"Sheet cache: ignoring unreadable {cache_path} ({e})")
+    sheet = sheets_api.get_sheet(sheet_id, column_ids=column_ids)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write-then-rename so an interrupted run never leaves a partial file
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(_sheet_cache_payload(sheet), f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logging.warning(f"Sheet cache: could not write {cache_path} ({e})")
+    else:
+        # Only the current version is ever read again; drop the copies of
+        # earlier versions so the cache holds one file per sheet+columns.
+        for stale_path in glob.glob(os.path.join(cache_dir, f"sheet_{sheet_id}_v*_{columns_key}.json")):
+            if stale_path != cache_path:
+                try:
+                    os.remove(stale_path)
+                except OSError as e:
+                    logging.warning(f"Sheet cache: could not remove {stale_path} ({e})")
+    return sheet
+
+def _sheet_cache_payload(sheet):
+    """Reduce a fetched sheet to the fields both row passes read.
+    
+    Only row ids and each cell's columnId/value/displayValue are kept.
+    Sheet.to_json() is not used: it writes timestamps such as
+    ``2024-05-01T12:00:00+00:00Z`` that smartsheet.models.Sheet cannot
+    parse back, so every real sheet would miss the cache.
+    """
+    rows = []
+    for row in sheet.rows or ():
+        cells = []
+        for cell in row.cells or ():
+            cell_payload = {'columnId': cell.column_id, 'value': cell.value}
+            if cell.display_value is not None:
+                cell_payload['displayValue'] = cell.display_value
+            cells.append(cell_payload)
+        rows.append({'id': row.id, 'cells': cells})
+    return {'id': sheet.id, 'version': sheet.version, 'rows': rows}
+
 def analyze_completed_rows_with_dates(client, source_sheets):
     """Analyze all rows marked as completed with valid dates to find pricing issues."""
     
@@ -85,129 +247,206 @@ def analyze_completed_rows_with_dates(client, source_sheets):
         'completed_with_dates_zero_price': 0,
         'completed_with_dates_invalid_price': 0,
         'price_format_issues': [],
-        'missing_fields_analysis': defaultdict(int),
+        'missing_fields_analysis': dict.fromkeys(_MISSING_FIELD_ISSUES, 0),
         'sample_excluded_rows': []
     }
     
-    for source in source_sheets:
+    # Per-row detail is capped at DEBUG_SAMPLE_ROWS rows across all sheets;
+    # every other row only updates the counters.
+    sample_limit = int(os.environ.get('DEBUG_SAMPLE_ROWS', '10') or 10)
+    sample_budget = sample_limit
+    
+    # Fetches run on a PARALLEL_WORKERS pool (the production fetch's cap),
+    # but executor.map yields them in source order, so per-sheet output,
+    # the DEBUG_SAMPLE_ROWS detail rows and sample_excluded_rows are the
+    # same on every run. Rows are analyzed on this thread, keeping the
+    # shared stats dict single-writer. In analyze_pricing_issues this pass
+    # runs after get_all_source_rows, so every fetch is a memo hit (see
+    # _SharedFetchClient) and the pool does no network I/O; it only
+    # overlaps downloads when this pass runs on its own.
+    fetch = partial(_fetch_mapped_columns_or_error, client)
+    with ThreadPoolExecutor(max_workers=PARALLEL_WORKERS) as executor:
+        for source, (sheet, error) in zip(source_sheets, executor.map(fetch, source_sheets)):
+            try:
+                print(f"\n🔍 Analyzing sheet: {source['name']}")
+                if error is not None:
+                    raise error
+                sample_budget = _analyze_completed_sheet_rows(
+                    sheet, source, stats, sample_budget
+                )
+            except Exception as e:
+                print(f"❌ Error processing sheet {source['name']}: {e}")
+    
+    shown = sample_limit - max(sample_budget, 0)
+    if stats['completed_with_dates'] > shown:
+        print(f"\n   ℹ️ Row detail shown for {shown} of {stats['completed_with_dates']:,} completed+dated rows (DEBUG_SAMPLE_ROWS={sample_limit})")
+    
+    return stats
+
+def _fetch_mapped_columns(client, source):
+    """Fetch a source sheet restricted to its mapped columns.
+    
+    Mirrors pipeline.fetch: unmapped columns are never read here, so
+    leaving them out shrinks the payload and the SDK objects built from it.
+    """
+    # Comma-joined so the API receives a single ?columnIds=1,2,3 parameter
+    # (a Python list is sent as repeated params, which the API ignores).
+    column_ids_param = ",".join(str(c) for c in source['column_mapping'].values())
+    return client.Sheets.get_sheet(source['id'], column_ids=column_ids_param)
+
+def _fetch_mapped_columns_or_error(client, source):
+    """Return ``(sheet, None)``, or ``(None, exc)`` if the fetch failed.
+    
+    Lets one failing sheet be reported in order without aborting the
+    executor.map iteration over the rest.
+    """
+    try:
+        return _fetch_mapped_columns(client, source), None
+    except Exception as e:
+        return None, e
+
+def _analyze_completed_sheet_rows(sheet, source, stats, sample_budget):
+    """Accumulate completed-with-dates pricing stats for one fetched sheet.
+    
+    Prints per-row detail for at most ``sample_budget`` rows and returns
+    the budget left over for the next sheet.
+    """
+    column_mapping = source['column_mapping']
+    # PERFORMANCE: column_id -> slot in _COMPLETED_ROW_FIELDS, built once per
+    # sheet, so each row fills a fixed-size list instead of a full row dict
+    field_slots = {
+        column_mapping[name]: slot
+        for slot, name in enumerate(_COMPLETED_ROW_FIELDS)
+        if name in column_mapping
+    }
+    units_completed_col_id = column_mapping.get('Units Completed?')
+    
+    for row in sheet.rows:
+        stats['total_rows_processed'] += 1
+        
+        # Check if this row is marked as completed before extracting the
+        # rest of it - most rows stop here
+        units_completed = next(
+            (cell.display_value or cell.value
+             for cell in row.cells if cell.column_id == units_completed_col_id),
+            None,
+        )
+        if not is_checked(units_completed):
+            continue
+        
+        # Extract only the fields analyzed below
+        values = [None] * len(_COMPLETED_ROW_FIELDS)
+        for cell in row.cells:
+            slot = field_slots.get(cell.column_id)
+            if slot is not None:
+                values[slot] = cell.display_value or cell.value
+        snapshot_date, weekly_date, work_request, price_raw = values
+        
+        # Check if it has valid dates
+        
+        if not (snapshot_date and weekly_date and work_request):
+            continue
+        
+        stats['completed_with_dates'] += 1
+        
+        verbose = sample_budget > 0
+        if verbose:
+            sample_budget -= 1
+        
+        # Now analyze the pricing
+        if verbose:
+            print(f"\n   📝 Row analysis:")
+            print(f"      WR: {work_request}")
+            print(f"      Snapshot Date: {snapshot_date}")
+            print(f"      Weekly Date: {weekly_date}")
+            print(f"      Units Completed?: {units_completed} -> {is_checked(units_completed)}")
+            print(f"      Raw Price: {price_raw!r}")
+        
+        if price_raw is None or price_raw == "":
+            stats['completed_with_dates_no_price'] += 1
+            stats['missing_fields_analysis']['price_completely_missing'] += 1
+            if verbose:
+                print(f"      ❌ ISSUE: Price field is completely missing/empty")
+            
+            if len(stats['sample_excluded_rows']) < 5:
+                stats['sample_excluded_rows'].append({
+                    'wr': work_request,
+                    'issue': 'Price field missing/empty',
+                    'raw_price': price_raw,
+                    'sheet': source['name']
+                })
+            continue
+        
         try:
-            print(f"\n🔍 Analyzing sheet: {source['name']}")
-            sheet = client.Sheets.get_sheet(source['id'])
-            column_mapping = source['column_mapping']
+            price_val = parse_price(price_raw)
+            if verbose:
+                print(f"      Parsed Price: ${price_val:.2f}")
             
-            for row in sheet.rows:
-                stats['total_rows_processed'] += 1
-                row_data = {}
-                
-                # Extract all mapped data
-                for cell in row.cells:
-                    for mapped_name, column_id in column_mapping.items():
-                        if cell.column_id == column_id:
-                            row_data[mapped_name] = cell.display_value or cell.value
-                            break
-                
-                # Check if this row is marked as completed
-                units_completed = row_data.get('Units Completed?')
-                if not is_checked(units_completed):
-                    continue
-                
-                # Check if it has valid dates
-                snapshot_date = row_data.get('Snapshot Date')
-                weekly_date = row_data.get('Weekly Reference Logged Date')
-                work_request = row_data.get('Work Request #')
-                
-                if not (snapshot_date and weekly_date and work_request):
-                    continue
-                
-                stats['completed_with_dates'] += 1
-                
-                # Now analyze the pricing
-                price_raw = row_data.get('Units Total Price')
-                print(f"\n   📝 Row analysis:")
-                print(f"      WR: {work_request}")
-                print(f"      Snapshot Date: {snapshot_date}")
-                print(f"      Weekly Date: {weekly_date}")
-                print(f"      Units Completed?: {units_completed} -> {is_checked(units_completed)}")
-                print(f"      Raw Price: {price_raw!r}")
-                
-                if price_raw is None or price_raw == "":
-                    stats['completed_with_dates_no_price'] += 1
-                    stats['missing_fields_analysis']['price_completely_missing'] += 1
-                    print(f"      ❌ ISSUE: Price field is completely missing/empty")
-                    
-                    if len(stats['sample_excluded_rows']) < 5:
-                        stats['sample_excluded_rows'].append({
-                            'wr': work_request,
-                            'issue': 'Price field missing/empty',
-                            'raw_price': price_raw,
-                            'sheet': source['name']
-                        })
-                    continue
+            if price_val <= 0:
+                stats['completed_with_dates_zero_price'] += 1
+                stats['missing_fields_analysis']['price_zero_or_negative'] += 1
+                if verbose:
+                    print(f"      ❌ ISSUE: Price is zero or negative")
                 
-                try:
-                    price_val = parse_price(price_raw)
-                    print(f"      Parsed Price: ${price_val:.2f}")
-                    
-                    if price_val <= 0:
-                        stats['completed_with_dates_zero_price'] += 1
-                        stats['missing_fields_analysis']['price_zero_or_negative'] += 1
-                        print(f"      ❌ ISSUE: Price is zero or negative")
-                        
-                        if len(stats['sample_excluded_rows']) < 5:
-                            stats['sample_excluded_rows'].append({
-                                'wr': work_request,
-                                'issue': 'Price is zero/negative',
-                                'raw_price': price_raw,
-                                'parsed_price': price_val,
-                                'sheet': source['name']
-                            })
-                    else:
-                        stats['completed_with_dates_and_price'] += 1
-                        print(f"      ✅ VALID: Row should be included in report")
-                        
-                except Exception as e:
-                    stats['completed_with_dates_invalid_price'] += 1
-                    stats['missing_fields_analysis']['price_parse_error'] += 1
-                    stats['price_format_issues'].append({
-                        'raw_value': price_raw,
-                        'error': str(e),
+                if len(stats['sample_excluded_rows']) < 5:
+                    stats['sample_excluded_rows'].append({
                         'wr': work_request,
+                        'issue': 'Price is zero/negative',
+                        'raw_price': price_raw,
+                        'parsed_price': price_val,
                         'sheet': source['name']
                     })
-                    print(f"      ❌ ISSUE: Price parsing failed - {e}")
-                    
-                    if len(stats['sample_excluded_rows']) < 5:
-                        stats['sample_excluded_rows'].append({
-                            'wr': work_request,
-                            'issue': f'Price parsing error: {e}',
-                            'raw_price': price_raw,
-                            'sheet': source['name']
-                        })
-        
+            else:
+                stats['completed_with_dates_and_price'] += 1
+                if verbose:
+                    print(f"      ✅ VALID: Row should be included in report")
+                
         except Exception as e:
-            print(f"❌ Error processing sheet {source['name']}: {e}")
-    
-    return stats
+            stats['completed_with_dates_invalid_price'] += 1
+            stats['missing_fields_analysis']['price_parse_error'] += 1
+            stats['price_format_issues'].append({
+                'raw_value': price_raw,
+                'error': str(e),
+                'wr': work_request,
+                'sheet': source['name']
+            })
+            if verbose:
+                print(f"      ❌ ISSUE: Price parsing failed - {e}")
+            
+            if len(stats['sample_excluded_rows']) < 5:
+                stats['sample_excluded_rows'].append({
+                    'wr': work_request,
+                    'issue': f'Price parsing error: {e}',
+                    'raw_price': price_raw,
+                    'sheet': source['name']
+                })
+    
+    return sample_budget
 
 def analyze_pricing_patterns(valid_rows):
     """Analyze pricing patterns in the valid rows that made it through filtering."""
     
     analysis = {
         'total_valid_rows': len(valid_rows),
-        'price_ranges': defaultdict(int),
+        'price_ranges': dict.fromkeys(('$0',) + _PRICE_RANGE_LABELS, 0),
         'zero_prices_included': 0,
         'missing_prices_included': 0,
         'price_format_variety': Counter(),
-        'work_requests_with_pricing_issues': defaultdict(list)
+        'work_requests_with_pricing_issues': defaultdict(set)
     }
     
+    def note_issue(wr, issue):
+        issues = analysis['work_requests_with_pricing_issues'][wr]
+        if len(issues) < _MAX_ISSUES_PER_WR:
+            issues.add(issue)
+    
     for row in valid_rows:
         price_raw = row.get('Units Total Price')
         wr = row.get('Work Request #')
         
         if price_raw is None or price_raw == "":
             analysis['missing_prices_included'] += 1
-            analysis['work_requests_with_pricing_issues'][wr].append('Missing price in valid row')
+            note_issue(wr, 'Missing price in valid row')
             continue
         
         try:
@@ -215,25 +454,29 @@ def analyze_pricing_patterns(valid_rows):
             
             if price_val <= 0:
                 analysis['zero_prices_included'] += 1
-                analysis['work_requests_with_pricing_issues'][wr].append(f'Zero price: {price_raw}')
+                note_issue(wr, f'Zero price: {price_raw}')
             
             # Categorize price ranges
             if price_val == 0:
-                analysis['price_ranges']['$0'] += 1
-            elif price_val < 100:
-                analysis['price_ranges']['$0.01-$99.99'] += 1
-            elif price_val < 1000:
-                analysis['price_ranges']['$100-$999.99'] += 1
-            elif price_val < 5000:
-                analysis['price_ranges']['$1,000-$4,999.99'] += 1
+                price_range = '$0'
             else:
-                analysis['price_ranges']['$5,000+'] += 1
-            
-            # Track price format variety
-            analysis['price_format_variety'][str(type(price_raw).__name__)] += 1
+                price_range = _PRICE_RANGE_LABELS[bisect.bisect_right(_PRICE_RANGE_EDGES, price_val)]
+            analysis['price_ranges'][price_range] += 1
             
         except Exception as e:
-            analysis['work_requests_with_pricing_issues'][wr].append(f'Price parse error: {e}')
+            note_issue(wr, f'Price parse error: {e}')
+    
+    # Track price format variety in one Counter pass over the rows that
+    # carry a price (missing prices are tallied separately above). Count by
+    # type object and resolve each distinct type's name once afterwards.
+    type_counts = Counter(
+        type(price_raw)
+        for price_raw in (row.get('Units Total Price') for row in valid_rows)
+        if price_raw is not None and price_raw != ""
+    )
+    analysis['price_format_variety'] = Counter(
+        {price_type.__name__: count for price_type, count in type_counts.items()}
+    )
     
     return analysis
 
@@ -254,7 +497,8 @@ def print_summary_report(completed_stats, pricing_analysis, valid_rows_count):
     
     print(f"\n🔍 MISSING FIELD BREAKDOWN:")
     for issue, count in completed_stats['missing_fields_analysis'].items():
-        print(f"   {issue}: {count:,}")
+        if count:
+            print(f"   {issue}: {count:,}")
     
     if completed_stats['price_format_issues']:
         print(f"\n⚠️ PRICE FORMAT ISSUES ({len(completed_stats['price_format_issues'])} cases):")
@@ -280,24 +524,46 @@ def print_summary_report(completed_stats, pricing_analysis, valid_rows_count):
     
     print(f"\n💰 PRICING PATTERNS IN VALID ROWS:")
     for price_range, count in sorted(pricing_analysis['price_ranges'].items()):
-        print(f"   {price_range}: {count:,} rows")
+        if count:
+            print(f"   {price_range}: {count:,} rows")
     
     if pricing_analysis['zero_prices_included'] > 0:
         print(f"\n⚠️ WARNING: {pricing_analysis['zero_prices_included']} valid rows have $0 prices!")
     
     if pricing_analysis['work_requests_with_pricing_issues']:
         print(f"\n🔧 WORK REQUESTS WITH ISSUES ({len(pricing_analysis['work_requests_with_pricing_issues'])} WRs):")
-        for wr, issues in list(pricing_analysis['work_requests_with_pricing_issues'].items())[:5]:
-            print(f"   WR {wr}: {', '.join(issues)}")
+        for wr, issues in itertools.islice(pricing_analysis['work_requests_with_pricing_issues'].items(), 5):
+            print(f"   WR {wr}: {', '.join(sorted(issues))}")
 
 def save_diagnostic_results(stats, analysis):
     """Save diagnostic results to JSON for further analysis."""
     
+    recommendations = generate_recommendations(stats, analysis)
+    
+    # The fixed buckets are pre-seeded with zeros; save only the ones that
+    # occurred, as the earlier defaultdict tallies did.
+    stats = {
+        **stats,
+        'missing_fields_analysis': {
+            issue: count for issue, count in stats['missing_fields_analysis'].items() if count
+        },
+    }
+    analysis = {
+        **analysis,
+        'price_ranges': {
+            price_range: count for price_range, count in analysis['price_ranges'].items() if count
+        },
+        # Issue sets are saved as sorted JSON arrays, not set reprs
+        'work_requests_with_pricing_issues': {
+            wr: sorted(issues) for wr, issues in analysis['work_requests_with_pricing_issues'].items()
+        },
+    }
+    
     results = {
         'timestamp': str(datetime.now()),
         'completed_rows_stats': stats,
-        'pricing_analysis': dict(analysis),
-        'recommendations': generate_recommendations(stats, analysis)
+        'pricing_analysis': analysis,
+        'recommendations': recommendations
     }
     
     with open('generated_docs/pricing_diagnostic_results.json', 'w') as f:
@@ -333,48 +599,54 @@ def generate_recommendations(stats, analysis):
     
     return recommendations
 
+_FILTER_LOGIC_REPORT = """
+🔍 ANALYZING FILTERING LOGIC FROM CODE
+================================================================================
+
+📋 REQUIRED CONDITIONS FOR ROW INCLUSION:
+   1. ✅ Work Request # must exist and not be empty
+   2. ✅ Weekly Reference Logged Date must exist and not be empty
+   3. ✅ Units Completed? must be checked/true (using is_checked() function)
+   4. ✅ Units Total Price must exist, be parseable, and > 0
+
+🔍 COMMON EXCLUSION REASONS:
+   • Missing Work Request # field
+   • Missing or invalid Weekly Reference Logged Date
+   • Units Completed? not checked (false, 0, empty, etc.)
+   • Units Total Price is missing, empty, $0, $0.00, or unparseable
+
+💰 PRICE PARSING LOGIC:
+   • Uses parse_price() function to convert string values to float
+   • Handles formats like: '$1,250.00', '1250.00', '$1250', etc.
+   • Excludes any row where parsed price <= 0
+
+⚠️ POTENTIAL ISSUES TO CHECK:
+   1. Column Mapping: Verify 'Units Total Price' column is correctly mapped
+      - Check for alternate names: 'Total Price', 'Redlined Total Price'
+   2. Data Format: Ensure price values are in recognizable format
+      - Avoid special characters, extra spaces, or text in price fields
+   3. Completion Status: Verify Units Completed? uses standard true/false values
+      - Acceptable: true, 1, 'true', 'yes', checked boxes
+      - Rejected: false, 0, '', 'false', 'no', unchecked boxes
+
+🛠️ DIAGNOSTIC STEPS:
+   1. Run with FILTER_DIAGNOSTICS=true to see exclusion counts
+   2. Run with DEBUG_SAMPLE_ROWS=10 to see detailed row analysis
+   3. Check generated logs for 'price_missing_or_zero' exclusions
+   4. Verify column mappings in discovered source sheets
+
+📊 TO RUN FULL DIAGNOSTIC WITH REAL DATA:
+   1. Set SMARTSHEET_API_TOKEN environment variable
+   2. Run: python diagnose_pricing_issues.py
+   3. Or run: FILTER_DIAGNOSTICS=true python generate_weekly_pdfs.py
+"""
+
 def analyze_filtering_logic():
     """Analyze the filtering logic to identify potential pricing issues without API access."""
     
-    print("\n🔍 ANALYZING FILTERING LOGIC FROM CODE")
-    print("=" * 80)
-    
-    print("\n📋 REQUIRED CONDITIONS FOR ROW INCLUSION:")
-    print("   1. ✅ Work Request # must exist and not be empty")
-    print("   2. ✅ Weekly Reference Logged Date must exist and not be empty") 
-    print("   3. ✅ Units Completed? must be checked/true (using is_checked() function)")
-    print("   4. ✅ Units Total Price must exist, be parseable, and > 0")
-    
-    print("\n🔍 COMMON EXCLUSION REASONS:")
-    print("   • Missing Work Request # field")
-    print("   • Missing or invalid Weekly Reference Logged Date")
-    print("   • Units Completed? not checked (false, 0, empty, etc.)")
-    print("   • Units Total Price is missing, empty, $0, $0.00, or unparseable")
-    
-    print("\n💰 PRICE PARSING LOGIC:")
-    print("   • Uses parse_price() function to convert string values to float")
-    print("   • Handles formats like: '$1,250.00', '1250.00', '$1250', etc.")
-    print("   • Excludes any row where parsed price <= 0")
-    
-    print("\n⚠️ POTENTIAL ISSUES TO CHECK:")
-    print("   1. Column Mapping: Verify 'Units Total Price' column is correctly mapped")
-    print("      - Check for alternate names: 'Total Price', 'Redlined Total Price'")
-    print("   2. Data Format: Ensure price values are in recognizable format")
-    print("      - Avoid special characters, extra spaces, or text in price fields")
-    print("   3. Completion Status: Verify Units Completed? uses standard true/false values")
-    print("      - Acceptable: true, 1, 'true', 'yes', checked boxes")
-    print("      - Rejected: false, 0, '', 'false', 'no', unchecked boxes")
-    
-    print("\n🛠️ DIAGNOSTIC STEPS:")
-    print("   1. Run with FILTER_DIAGNOSTICS=true to see exclusion counts")
-    print("   2. Run with DEBUG_SAMPLE_ROWS=10 to see detailed row analysis")
-    print("   3. Check generated logs for 'price_missing_or_zero' exclusions")
-    print("   4. Verify column mappings in discovered source sheets")
-    
-    print("\n📊 TO RUN FULL DIAGNOSTIC WITH REAL DATA:")
-    print("   1. Set SMARTSHEET_API_TOKEN environment variable")
-    print("   2. Run: python diagnose_pricing_issues.py")
-    print("   3. Or run: FILTER_DIAGNOSTICS=true python generate_weekly_pdfs.py")
+    # Static text: emitted with a single write rather than ~40 print calls.
+    sys.stdout.write(_FILTER_LOGIC_REPORT)
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     analyze_pricing_issues()
\ No newline at end of file
@@ -16,10 +16,13 @@ Symbols relocated byte-for-byte from ``generate_weekly_pdfs.py`` (W4):
 """
 from __future__ import annotations
 
+import bisect
 import collections
 import datetime
+import itertools
 import logging
 import os
+import weakref
 from datetime import timedelta
 
 import openpyxl
@@ -40,39 +43,83 @@ logger = logging.getLogger(__name__)
 
 
 
+# Per-worksheet merge index for safe_merge_cells, held weakly so a
+# discarded workbook's index goes with it and nothing is set on openpyxl's
+# Worksheet objects.
+_MERGED_BOUNDS_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _merged_bounds_index(ws):
+    """Return ``(index, seen)`` describing ``ws``'s merged ranges.
+
+    ``index`` is a list of ``(max_row, min_row, min_col, max_col)`` tuples
+    sorted by bottom row; ``seen`` is the set of the same tuples for O(1)
+    exact-duplicate checks. Both are read from each ``MergedCellRange``'s
+    integer attributes, so no range string is re-parsed or re-formatted.
+    They are cached per worksheet and rebuilt only when the merged-range
+    count no longer matches the index. That catches merges or unmerges made
+    outside ``safe_merge_cells`` that change the count; an outside unmerge
+    followed by an outside merge leaves the count (and so a stale index)
+    unchanged, so code that mixes ``ws.unmerge_cells`` with this helper must
+    call ``_MERGED_BOUNDS_CACHE.pop(ws, None)`` after unmerging.
+    """
+    ranges = ws.merged_cells.ranges
+    cached = _MERGED_BOUNDS_CACHE.get(ws)
+    if cached is None or len(cached[0]) != len(ranges):
+        index = sorted(
+            (m.max_row, m.min_row, m.min_col, m.max_col) for m in ranges
+        )
+        cached = (index, set(index))
+        _MERGED_BOUNDS_CACHE[ws] = cached
+    return cached
+
+
 def safe_merge_cells(ws, range_str):
     """
     Safely merge cells, avoiding duplicates and overlaps that cause XML errors.
-    
+
+    Existing merges are looked up through ``_merged_bounds_index``: because
+    the sheet is built top-down, only the few merges whose bottom row
+    reaches the requested range need the overlap test, instead of every
+    merge on the sheet being re-parsed on every call.
+
     Args:
         ws: The worksheet object
         range_str: The range string (e.g., 'A1:C3')
-    
+
     Returns:
         bool: True if merge was successful, False if skipped
     """
     from openpyxl.utils import range_boundaries
-    
+
     try:
         # Parse the requested range boundaries
         min_col, min_row, max_col, max_row = range_boundaries(range_str)
         if min_col is None or min_row is None or max_col is None or max_row is None:
             return False
-        
-        # Check for any overlapping or duplicate merged ranges
-        for merged in list(ws.merged_cells.ranges):
-            m_min_col, m_min_row, m_max_col, m_max_row = range_boundaries(str(merged))
-            if m_min_col is None or m_min_row is None or m_max_col is None or m_max_row is None:
-                continue
-            
+
+        bounds = (max_row, min_row, min_col, max_col)
+        index, seen = _merged_bounds_index(ws)
+        if bounds in seen:
+            # Exact duplicate - skip without scanning
+            return False
+
+        # Check for any overlapping merged ranges. Merges that end above
+        # min_row cannot overlap, so start at the first entry whose
+        # max_row >= min_row.
+        for m_max_row, m_min_row, m_min_col, m_max_col in itertools.islice(
+            index, bisect.bisect_left(index, (min_row,)), None
+        ):
             # Check if ranges overlap (not just exact match)
             if not (max_col < m_min_col or min_col > m_max_col or
-                    max_row < m_min_row or min_row > m_max_row):
+                    max_row < m_min_row):
                 # Ranges overlap - skip to avoid XML corruption
                 return False
-        
+
         # Safe to merge - no overlaps detected
         ws.merge_cells(range_str)
+        bisect.insort(index, bounds)
+        seen.add(bounds)
         return True
     except Exception as e:
         logging.warning(f"Failed to merge cells {range_str}: {e}")
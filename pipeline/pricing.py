@@ -136,14 +136,25 @@ def parse_price(price_str: str | float | int | None) -> float:
         price_str: Price value as string, float, int, or None
     
     Returns:
-        float: Parsed price value, or 0.0 if parsing fails
+        float: Parsed price value, or 0.0 if parsing fails or the result
+        is not finite
     """
     if not price_str:
         return 0.0
     try:
-        return float(str(price_str).replace('$', '').replace(',', ''))
-    except (ValueError, TypeError):
+        # PERFORMANCE: the Smartsheet SDK hands numeric cells back as
+        # int/float, so skip the str() round-trip for them. bool is excluded
+        # because str(True) has always parsed to 0.0 here.
+        if isinstance(price_str, (int, float)) and not isinstance(price_str, bool):
+            price = float(price_str)
+        else:
+            price = float(str(price_str).replace('$', '').replace(',', ''))
+    except (ValueError, TypeError, OverflowError):
         return 0.0
+    # Same non-finite gate as _parse_quantity: float() accepts 'nan' and
+    # '1e999' (-> inf), and a non-finite price would slip past every
+    # caller's ``price <= 0`` check.
+    return price if math.isfinite(price) else 0.0
 
 
 def load_contract_rates(filepath):
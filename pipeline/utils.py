@@ -22,6 +22,15 @@ from pipeline import config as _cfg  # noqa: F401  (declared W1 config dependenc
 
 logger = logging.getLogger(__name__)
 
+# PERFORMANCE: exact spellings Smartsheet checkbox/text cells actually
+# return, mapped to their is_checked() result so the common case is one
+# hash lookup instead of a strip()+lower() allocation per row.
+_CHECKBOX_STRING_LOOKUP = {
+    **dict.fromkeys(('true', 'True', 'TRUE', 'checked', 'Checked',
+                     'yes', 'Yes', 'YES', '1', 'on', 'On'), True),
+    **dict.fromkeys(('false', 'False', 'FALSE', 'unchecked', 'no', 'No',
+                     '0', 'off', ''), False),
+}
 
 
 def is_checked(value: bool | int | str | None) -> bool:
@@ -40,6 +49,9 @@ def is_checked(value: bool | int | str | None) -> bool:
     if isinstance(value, int):
         return value == 1
     if isinstance(value, str):
+        known = _CHECKBOX_STRING_LOOKUP.get(value)
+        if known is not None:
+            return known
         return value.strip().lower() in ('true', 'checked', 'yes', '1', 'on')
     return False
 
@@ -59,9 +71,16 @@ def excel_serial_to_date(value):
     s = str(value).strip()
     # PERFORMANCE: Fast-path for ISO date format (most common in Smartsheet)
     if len(s) >= 10 and s[4] == '-' and s[7] == '-':
+        # Try ISO format first (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS).
+        # fromisoformat is ~20x cheaper than strptime for this shape, but
+        # it rejects space-padded fields ('2016-02- 9') that strptime has
+        # always accepted, so strptime stays as the second try.
+        date_part = s[:10]
+        try:
+            return datetime.datetime.fromisoformat(date_part)
+        except ValueError:
+            pass
         try:
-            # Try ISO format first (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)
-            date_part = s[:10]
             return datetime.datetime.strptime(date_part, '%Y-%m-%d')
         except ValueError:
             pass  # Fall through to general parser
@@ -0,0 +1,207 @@
+"""Tests for ``diagnose_pricing_issues.py``.
+
+Covers:
+  * ``_SharedFetchClient`` — the production fetch (``get_all_source_rows``)
+    and the diagnostic's completed-rows pass download each source sheet
+    once between them, without patching the real SDK client.
+  * ``_load_or_fetch_sheet`` — the version-keyed on-disk cache: hits skip
+    the download, a new version re-fetches and prunes the old file, and
+    unreadable files or version-lookup failures fall back to a live fetch.
+  * ``save_diagnostic_results`` — per-WR issue sets are written as sorted
+    JSON arrays, and zero-count pre-seeded buckets are left out.
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# No conftest.py: bootstrap the repo root so this file also runs alone.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+import smartsheet  # noqa: E402
+
+# The diagnostic sets its debug env vars at import time; keep them (and
+# the facade's Sentry init) out of the rest of the test session.
+with mock.patch.dict(os.environ, {"SENTRY_DSN": ""}, clear=False):
+    with mock.patch("sentry_sdk.init"):
+        import diagnose_pricing_issues as diag  # noqa: E402
+        from pipeline.fetch import get_all_source_rows  # noqa: E402
+
+
+class _StubSheets:
+    """Counts ``get_sheet`` calls per (sheet_id, kwargs) shape."""
+
+    def __init__(self):
+        self.calls = Counter()
+
+    def get_sheet(self, sheet_id, **kwargs):
+        self.calls[sheet_id] += 1
+        return SimpleNamespace(rows=[])
+
+
+class TestSharedFetchClient(unittest.TestCase):
+    SOURCES = [
+        {'id': 111, 'name': 'Sheet A',
+         'column_mapping': {'Work Request #': 1, 'Units Total Price': 2}},
+        {'id': 222, 'name': 'Sheet B',
+         'column_mapping': {'Work Request #': 1, 'Units Total Price': 2}},
+    ]
+
+    def setUp(self):
+        self.sheets = _StubSheets()
+        self.raw_client = SimpleNamespace(Sheets=self.sheets, marker='raw')
+        self.client = diag._SharedFetchClient(self.raw_client)
+
+    def test_both_passes_fetch_each_sheet_once(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            get_all_source_rows(self.client, self.SOURCES)
+            diag.analyze_completed_rows_with_dates(self.client, self.SOURCES)
+        self.assertEqual(self.sheets.calls, Counter({111: 1, 222: 1}))
+        # Each memo entry is released once the second pass has read it.
+        self.assertEqual(self.client.Sheets._fetched, {})
+
+    def test_other_call_shapes_pass_through(self):
+        self.client.Sheets.get_sheet(111, include='columns')
+        self.client.Sheets.get_sheet(111, include='columns')
+        self.assertEqual(self.sheets.calls[111], 2)
+
+    def test_real_client_is_not_modified(self):
+        self.client.Sheets.get_sheet(111, column_ids='1,2')
+        self.assertIs(self.raw_client.Sheets, self.sheets)
+        self.assertNotIn('get_sheet', vars(self.sheets))
+        self.assertEqual(self.client.marker, 'raw')
+
+
+class _VersionedStubSheets:
+    """Serves one SDK ``Sheet`` per call and a settable sheet version."""
+
+    def __init__(self):
+        self.version = 1
+        self.get_sheet_calls = 0
+        self.version_error = None
+
+    def get_sheet_version(self, sheet_id):
+        if self.version_error is not None:
+            raise self.version_error
+        return SimpleNamespace(version=self.version)
+
+    def get_sheet(self, sheet_id, **kwargs):
+        # Shaped like a real response: sheet- and row-level timestamps are
+        # what Sheet.to_json() fails to round-trip.
+        self.get_sheet_calls += 1
+        return smartsheet.models.Sheet({
+            'id': sheet_id,
+            'version': self.version,
+            'createdAt': '2024-05-01T12:00:00Z',
+            'modifiedAt': '2024-05-02T08:30:00Z',
+            'rows': [{
+                'id': 1,
+                'rowNumber': 1,
+                'createdAt': '2024-05-01T12:00:00Z',
+                'modifiedAt': '2024-05-02T08:30:00Z',
+                'cells': [
+                    {'columnId': 2, 'value': 1200.0, 'displayValue': '$1,200.00'},
+                    {'columnId': 3, 'value': True},
+                    {'columnId': 4},
+                ],
+            }],
+        })
+
+
+class TestSheetDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        self.sheets = _VersionedStubSheets()
+
+    def _run(self):
+        # A fresh wrapper per call stands in for a fresh diagnostic run.
+        client = diag._SharedFetchClient(
+            SimpleNamespace(Sheets=self.sheets), self.cache_dir
+        )
+        return client.Sheets.get_sheet(111, column_ids='2')
+
+    def test_same_version_is_served_from_disk(self):
+        live = self._run()
+        with self.assertNoLogs(level='WARNING'):
+            cached = self._run()
+        self.assertEqual(self.sheets.get_sheet_calls, 1)
+        self.assertEqual(cached.rows[0].id, live.rows[0].id)
+        self.assertEqual(
+            [(c.column_id, c.value, c.display_value) for c in cached.rows[0].cells],
+            [(c.column_id, c.value, c.display_value) for c in live.rows[0].cells],
+        )
+
+    def test_new_version_refetches_and_prunes_old_file(self):
+        self._run()
+        self.sheets.version = 2
+        self._run()
+        self.assertEqual(self.sheets.get_sheet_calls, 2)
+        files = os.listdir(self.cache_dir)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith('sheet_111_v2_'), files)
+
+    def test_unreadable_cache_file_falls_back_to_live_fetch(self):
+        self._run()
+        (cache_file,) = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, cache_file), 'w') as f:
+            f.write('{not json')
+        with self.assertLogs(level='WARNING'):
+            sheet = self._run()
+        self.assertEqual(self.sheets.get_sheet_calls, 2)
+        self.assertEqual(sheet.rows[0].cells[0].display_value, '$1,200.00')
+
+    @unittest.skipIf('USE_DIAG_SHEET_CACHE' in os.environ,
+                     'USE_DIAG_SHEET_CACHE set in the environment')
+    def test_cache_is_opt_in_under_generated_docs(self):
+        self.assertFalse(diag.USE_DIAG_SHEET_CACHE)
+        self.assertEqual(
+            os.path.dirname(diag.DIAG_SHEET_CACHE_DIR), 'generated_docs'
+        )
+
+    def test_version_lookup_failure_falls_back_to_live_fetch(self):
+        self.sheets.version_error = RuntimeError('version endpoint down')
+        with self.assertLogs(level='WARNING'):
+            sheet = self._run()
+        self.assertEqual(self.sheets.get_sheet_calls, 1)
+        self.assertEqual(sheet.rows[0].cells[0].display_value, '$1,200.00')
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+class TestSaveDiagnosticResults(unittest.TestCase):
+    def test_issue_sets_are_saved_as_sorted_arrays(self):
+        import json
+        analysis = diag.analyze_pricing_patterns([
+            {'Units Total Price': 0, 'Work Request #': 'WR1'},
+            {'Units Total Price': '', 'Work Request #': 'WR1'},
+        ])
+        stats = {'missing_fields_analysis': dict.fromkeys(diag._MISSING_FIELD_ISSUES, 0)}
+        workdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, workdir, ignore_errors=True)
+        os.makedirs(os.path.join(workdir, 'generated_docs'))
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        self.addCleanup(os.chdir, cwd)
+        with mock.patch.object(diag, 'generate_recommendations', return_value=[]), \
+                contextlib.redirect_stdout(io.StringIO()):
+            diag.save_diagnostic_results(stats, analysis)
+        with open(os.path.join('generated_docs', 'pricing_diagnostic_results.json')) as f:
+            saved = json.load(f)
+        self.assertEqual(
+            saved['pricing_analysis']['work_requests_with_pricing_issues'],
+            {'WR1': ['Missing price in valid row', 'Zero price: 0']},
+        )
+        self.assertEqual(saved['completed_rows_stats']['missing_fields_analysis'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 
+import datetime
 import importlib
 import os
 import unittest
@@ -436,5 +437,113 @@ class TestPppAttachmentPrefetchBudget(unittest.TestCase):
         )
 
 
+class TestSafeMergeCellsIndex(unittest.TestCase):
+    """``safe_merge_cells`` keeps a cached, row-sorted bounds index per
+    worksheet instead of re-parsing every merged range per call. The
+    overlap guard must behave exactly as the linear scan did."""
+
+    def setUp(self):
+        import openpyxl
+        self.ws = openpyxl.Workbook().active
+        self.merge = generate_weekly_pdfs.safe_merge_cells
+
+    def test_overlap_and_adjacent_ranges(self):
+        self.assertTrue(self.merge(self.ws, 'A1:C3'))
+        self.assertTrue(self.merge(self.ws, 'D1:I1'))
+        self.assertTrue(self.merge(self.ws, 'A4:C4'))
+        self.assertFalse(self.merge(self.ws, 'B2:B2'))
+        self.assertFalse(self.merge(self.ws, 'C3:E5'))
+        self.assertFalse(self.merge(self.ws, 'A1:C3'))
+        self.assertEqual(
+            sorted(str(r) for r in self.ws.merged_cells.ranges),
+            ['A1:C3', 'A4:C4', 'D1:I1'],
+        )
+
+    def test_external_merge_invalidates_cache(self):
+        self.assertTrue(self.merge(self.ws, 'A10:C10'))
+        # A merge made behind the guard's back must still be honoured.
+        self.ws.merge_cells('E1:F20')
+        self.assertFalse(self.merge(self.ws, 'F5:G5'))
+        self.assertTrue(self.merge(self.ws, 'G5:H5'))
+
+    def test_index_is_held_weakly_off_the_worksheet(self):
+        import gc
+        import weakref
+        from pipeline.excel import _MERGED_BOUNDS_CACHE
+        self.assertTrue(self.merge(self.ws, 'A1:B1'))
+        self.assertIn(self.ws, _MERGED_BOUNDS_CACHE)
+        self.assertFalse(hasattr(self.ws, '_safe_merge_bounds'))
+        ws_ref = weakref.ref(self.ws)
+        self.ws = None
+        gc.collect()
+        self.assertIsNone(ws_ref())
+
+
+class TestParsePriceNumericFastPath(unittest.TestCase):
+    """Numeric cells skip the str()/replace round-trip; results must be
+    unchanged for every input shape the sheets produce."""
+
+    def test_parse_price_contract(self):
+        parse_price = generate_weekly_pdfs.parse_price
+        self.assertEqual(parse_price(1234.5), 1234.5)
+        self.assertEqual(parse_price(7), 7.0)
+        self.assertIsInstance(parse_price(7), float)
+        self.assertEqual(parse_price('$1,234.50'), 1234.5)
+        self.assertEqual(parse_price(' 12 '), 12.0)
+        self.assertEqual(parse_price('n/a'), 0.0)
+        self.assertEqual(parse_price(None), 0.0)
+        self.assertEqual(parse_price(''), 0.0)
+        self.assertEqual(parse_price(0), 0.0)
+        # Historical behaviour: booleans parse via str() and fail to 0.0.
+        self.assertEqual(parse_price(True), 0.0)
+
+    def test_overflow_and_non_finite_parse_to_zero(self):
+        parse_price = generate_weekly_pdfs.parse_price
+        self.assertEqual(parse_price(10 ** 400), 0.0)
+        self.assertEqual(parse_price(float('inf')), 0.0)
+        self.assertEqual(parse_price(float('nan')), 0.0)
+        self.assertEqual(parse_price('1e999'), 0.0)
+        self.assertEqual(parse_price('nan'), 0.0)
+
+
+class TestIsCheckedLookupFastPath(unittest.TestCase):
+    """The exact-spelling lookup table in ``pipeline.utils`` must agree
+    with the strip()/lower() fallback for every key it short-circuits."""
+
+    def test_lookup_matches_normalized_rule(self):
+        from pipeline.utils import _CHECKBOX_STRING_LOOKUP
+        truthy = ('true', 'checked', 'yes', '1', 'on')
+        for raw, expected in _CHECKBOX_STRING_LOOKUP.items():
+            self.assertEqual(
+                expected, raw.strip().lower() in truthy, raw
+            )
+
+    def test_is_checked_unlisted_strings_fall_back(self):
+        is_checked = generate_weekly_pdfs.is_checked
+        self.assertTrue(is_checked(' Yes '))
+        self.assertTrue(is_checked('CHECKED'))
+        self.assertFalse(is_checked('maybe'))
+        self.assertTrue(is_checked(True))
+        self.assertFalse(is_checked(2))
+        self.assertFalse(is_checked(None))
+
+
+class TestExcelSerialToDateIsoFastPath(unittest.TestCase):
+    """The ``fromisoformat`` fast path must not narrow what the former
+    ``strptime('%Y-%m-%d')`` path accepted."""
+
+    def test_iso_dates_and_datetimes(self):
+        parse = generate_weekly_pdfs.excel_serial_to_date
+        self.assertEqual(parse('2026-04-23'), datetime.datetime(2026, 4, 23))
+        self.assertEqual(
+            parse('2026-04-23T15:30:00Z'), datetime.datetime(2026, 4, 23)
+        )
+
+    def test_space_padded_fields_still_parse(self):
+        parse = generate_weekly_pdfs.excel_serial_to_date
+        self.assertEqual(parse('2016-02- 9'), datetime.datetime(2016, 2, 9))
+        self.assertEqual(parse('2016- 2-09'), datetime.datetime(2016, 2, 9))
+
+
 if __name__ == '__main__':
     unittest.main()